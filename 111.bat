@@ -74,19 +74,16 @@ echo        如需保留，请在倒计时提示时按 N。
 echo.
 
 REM ========= 仅监控本次会话相关的 chrome 进程 =========
-:waitloop
-for /f "usebackq delims=" %%c in (`
-    powershell -NoProfile -Command ^
-      "$p=[regex]::Escape('%BASE_DIR%');" ^
-      ";(Get-CimInstance Win32_Process | Where-Object { $_.Name -eq 'chrome.exe' -and $_.CommandLine -match $p }).Count"
-`) do set "PROC_COUNT=%%c"
-
-if not defined PROC_COUNT set "PROC_COUNT=0"
-
-if %PROC_COUNT% GTR 0 (
-    timeout /t 2 /nobreak >nul
-    goto :waitloop
-)
+REM 由单个 PowerShell 阻塞等待这些进程退出，不再每 2 秒重新启动 PowerShell 轮询
+REM 只等待主浏览器进程（跳过带 --type= 的子进程），剩余子进程在下一轮查询中处理
+powershell -NoProfile -Command ^
+    "$p=[regex]::Escape('%BASE_DIR%');" ^
+    "while ($procs = @(Get-CimInstance Win32_Process -Filter 'Name=''chrome.exe''' -Property ProcessId,CommandLine | Where-Object { $_.CommandLine -match $p })) {" ^
+    "  $ids = @($procs | Where-Object { $_.CommandLine -notmatch '--type=' }).ProcessId;" ^
+    "  if (-not $ids) { $ids = $procs.ProcessId };" ^
+    "  Wait-Process -Id $ids -ErrorAction SilentlyContinue;" ^
+    "  if (-not $?) { Start-Sleep -Seconds 1 }" ^
+    "}"
 
 echo.
 echo 检测到本次会话的所有 Chrome 窗口已关闭。